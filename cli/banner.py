@@ -1,5 +1,7 @@
 """ASCII art banner for ClawQuant CLI."""
 
+import sys
+
 BANNER = r"""
    _____ _                 ____                    _            
   / ____| |               / __ \                  | |           
@@ -11,9 +13,10 @@ BANNER = r"""
 
 TAGLINE = "Lightweight event-driven trading advisory system"
 
+# Banner + tagline + trailing blank line, written in one go
+_FULL_BANNER = f"{BANNER}\n  {TAGLINE}\n\n"
+
 
 def print_banner() -> None:
     """Print the banner and tagline."""
-    print(BANNER)
-    print(f"  {TAGLINE}")
-    print()
+    sys.stdout.write(_FULL_BANNER)
@@ -10,8 +10,6 @@ import logging
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from cli.scanner import PluginInfo
 
 logger = logging.getLogger(__name__)
@@ -58,6 +56,8 @@ def generate_config(
         _add_plugin_to_config(config, secrets, plugin, values)
 
     # Write config.yaml
+    import yaml
+
     config_path = home_dir / "config.yaml"
     with open(config_path, "w") as f:
         f.write("# ClawQuant Configuration\n")
@@ -1,6 +1,6 @@
 """Plugin scanner -- auto-discovers PLUGIN_META from the plugins/ directory.
 
-Walks all Python files under plugins/, imports them, and collects any
+Walks all Python files under plugins/ in a single pass and collects any
 module-level PLUGIN_META dicts. This is what makes the system fully
 dynamic: add a new plugin file with PLUGIN_META and it automatically
 appears in the setup wizard and CLI.
@@ -9,14 +9,23 @@ appears in the setup wizard and CLI.
 from __future__ import annotations
 
 import ast
-import importlib
+import hashlib
 import logging
+import os
+import pickle
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# On-disk discovery index (stored under the ClawQuant home directory)
+PLUGIN_INDEX_FILENAME = "plugin_index.pkl"
+_PLUGIN_INDEX_VERSION = 1
+
+# name -> PluginInfo for the default plugins/ directory, filled by get_plugin()
+_PLUGIN_BY_NAME: dict[str, PluginInfo] = {}
+
 # Categories in the order they should be presented to the user
 CATEGORY_ORDER = [
     "ai_provider",
@@ -96,44 +105,137 @@ def discover_plugins(plugins_dir: Path | None = None) -> dict[str, list[PluginIn
     if plugins_dir is None:
         plugins_dir = Path(__file__).parent.parent / "plugins"
 
-    results: dict[str, list[PluginInfo]] = {cat: [] for cat in CATEGORY_ORDER}
+    return _discover_from_files(_plugin_files(plugins_dir), plugins_dir)
 
-    # Walk all subdirectories of plugins/
-    for subdir in sorted(plugins_dir.iterdir()):
-        if not subdir.is_dir() or subdir.name.startswith("_"):
-            continue
 
-        for filepath in sorted(subdir.glob("*.py")):
-            if filepath.name.startswith("_"):
-                continue
+def discover_plugins_cached(
+    home_dir: Path,
+    plugins_dir: Path | None = None,
+) -> dict[str, list[PluginInfo]]:
+    """Like discover_plugins(), but reuses an on-disk index when nothing changed.
+
+    The index lives at home_dir/plugin_index.pkl and is keyed by the path,
+    mtime and size of every plugin file, so editing, adding or removing a
+    plugin invalidates it automatically.
+    """
+    if plugins_dir is None:
+        plugins_dir = Path(__file__).parent.parent / "plugins"
+
+    files = _plugin_files(plugins_dir)
+    key = _plugin_index_key(files)
+    index_path = home_dir / PLUGIN_INDEX_FILENAME
+
+    cached = _read_plugin_index(index_path, key)
+    if cached is not None:
+        return cached
+
+    results = _discover_from_files(files, plugins_dir)
+    _write_plugin_index(index_path, key, results)
+    return results
 
-            plugin = _load_plugin_meta(filepath, plugins_dir)
-            if plugin:
-                category = plugin.category
-                if category not in results:
-                    results[category] = []
-                results[category].append(plugin)
+
+def _plugin_files(plugins_dir: Path) -> list[tuple[Path, os.stat_result]]:
+    """List plugin source files with their stat results, in sorted order.
+
+    One os.scandir() walk over plugins/ (explicit stack, no rglob). Files
+    directly under plugins/, names starting with "_" and symlinked
+    directories are skipped.
+    """
+    files: list[tuple[Path, os.stat_result]] = []
+    stack: list[tuple[str, int]] = [(str(plugins_dir), 0)]
+    while stack:
+        current, depth = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.name.startswith("_"):
+                        continue
+                    try:
+                        # Don't follow directory symlinks (as os.walk): a link
+                        # back up the tree would otherwise recurse forever.
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append((entry.path, depth + 1))
+                        elif depth > 0 and entry.name.endswith(".py") and entry.is_file():
+                            files.append((Path(entry.path), entry.stat()))
+                    except OSError:
+                        continue
+        except OSError:
+            logger.debug("Could not scan plugin directory %s", current)
+
+    files.sort(key=lambda item: item[0])
+    return files
+
+
+def _discover_from_files(
+    files: list[tuple[Path, os.stat_result]],
+    plugins_dir: Path,
+) -> dict[str, list[PluginInfo]]:
+    results: dict[str, list[PluginInfo]] = {cat: [] for cat in CATEGORY_ORDER}
+
+    for filepath, _ in files:
+        plugin = _load_plugin_meta(filepath, plugins_dir)
+        if plugin:
+            category = plugin.category
+            if category not in results:
+                results[category] = []
+            results[category].append(plugin)
 
     # Remove empty categories
     return {k: v for k, v in results.items() if v}
 
 
+def _plugin_index_key(files: list[tuple[Path, os.stat_result]]) -> str:
+    """Fingerprint plugin files (and the scanner itself) by path, mtime and size."""
+    digest = hashlib.sha256(str(_PLUGIN_INDEX_VERSION).encode())
+    scanner_path = Path(__file__)
+    for filepath, stat in [(scanner_path, scanner_path.stat()), *files]:
+        digest.update(f"{filepath}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+    return digest.hexdigest()
+
+
+def _read_plugin_index(index_path: Path, key: str) -> dict[str, list[PluginInfo]] | None:
+    try:
+        with open(index_path, "rb") as f:
+            index = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.debug("Ignoring unreadable plugin index %s", index_path)
+        return None
+
+    if not isinstance(index, dict) or index.get("key") != key:
+        return None
+    plugins = index.get("plugins")
+    if not isinstance(plugins, dict):
+        return None
+    return plugins
+
+
+def _write_plugin_index(index_path: Path, key: str, plugins: dict[str, list[PluginInfo]]) -> None:
+    tmp_path = index_path.with_suffix(".tmp")
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"key": key, "plugins": plugins}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(index_path)
+    except Exception:
+        logger.debug("Could not write plugin index %s", index_path)
+
+
 def _load_plugin_meta(filepath: Path, plugins_root: Path) -> PluginInfo | None:
-    """Extract PLUGIN_META from source (preferred) or module import (fallback)."""
+    """Build PluginInfo from the module's literal PLUGIN_META (never imports it).
+
+    The module itself is only imported when the plugin is instantiated at
+    runtime or its setup hook runs.
+    """
     # Build module path: plugins/integrations/telegram.py -> plugins.integrations.telegram
     relative = filepath.relative_to(plugins_root.parent)
     module_path = str(relative.with_suffix("")).replace("/", ".").replace("\\", ".")
 
     meta = _extract_plugin_meta_from_source(filepath)
     if meta is None:
-        try:
-            module = importlib.import_module(module_path)
-            meta = getattr(module, "PLUGIN_META", None)
-        except Exception:
-            logger.debug("Could not import %s", module_path)
-            return None
-        if not meta or not isinstance(meta, dict):
-            return None
+        logger.debug("No literal PLUGIN_META found in %s", module_path)
+        return None
 
     # Parse config fields
     config_fields = []
@@ -170,7 +272,7 @@ def _load_plugin_meta(filepath: Path, plugins_root: Path) -> PluginInfo | None:
 def _extract_plugin_meta_from_source(filepath: Path) -> dict[str, Any] | None:
     """Parse module source and literal-evaluate PLUGIN_META without importing."""
     try:
-        source = filepath.read_text(encoding="utf-8")
+        source = filepath.read_bytes()
     except Exception:
         return None
 
@@ -201,8 +303,19 @@ def list_all_plugins(plugins_dir: Path | None = None) -> list[PluginInfo]:
 
 
 def get_plugin(name: str, plugins_dir: Path | None = None) -> PluginInfo | None:
-    """Find a specific plugin by name."""
-    for plugin in list_all_plugins(plugins_dir):
-        if plugin.name == name:
-            return plugin
-    return None
+    """Find a specific plugin by name.
+
+    Lookups in the default plugins/ directory are served from a per-process
+    name index built by the first call.
+    """
+    if plugins_dir is not None:
+        for plugin in list_all_plugins(plugins_dir):
+            if plugin.name == name:
+                return plugin
+        return None
+
+    if not _PLUGIN_BY_NAME:
+        for plugin in list_all_plugins():
+            # First match wins, as with a linear scan
+            _PLUGIN_BY_NAME.setdefault(plugin.name, plugin)
+    return _PLUGIN_BY_NAME.get(name)
@@ -8,16 +8,22 @@ plugin file automatically makes it appear in the wizard.
 from __future__ import annotations
 
 import importlib
+import os
+import shlex
 import subprocess
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import questionary
 import yaml
-from dotenv import dotenv_values
 from questionary import Choice
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from cli.banner import print_banner
 from cli.config_gen import _add_plugin_to_config, generate_config
 from cli.scanner import (
@@ -25,7 +31,7 @@ from cli.scanner import (
     CATEGORY_ORDER,
     ConfigField,
     PluginInfo,
-    discover_plugins,
+    discover_plugins_cached,
 )
 
 # Questionary style
@@ -39,6 +45,16 @@ STYLE = questionary.Style([
     ("instruction", "fg:gray italic"),
 ])
 
+# Where each plugin category lives in config.yaml
+_CATEGORY_PATHS: dict[str, tuple[str, ...]] = {
+    "ai_provider": ("ai", "providers"),
+    "market_data": ("market_data", "providers"),
+    "integration": ("integrations",),
+    "risk_rule": ("risk", "rules"),
+    "task_handler": ("scheduler", "handlers"),
+    "agent": ("ai", "agents"),
+}
+
 
 def run_setup(home_dir: Path | None = None) -> None:
     """Run the full interactive setup wizard."""
@@ -59,7 +75,9 @@ def run_setup(home_dir: Path | None = None) -> None:
     home_dir = home_dir.expanduser()
 
     first_setup = not (home_dir / "config.yaml").exists()
-    existing_auto_update, existing_install_commit = _load_existing_update_settings(home_dir)
+    # Parsed once and shared by every "existing state" helper below.
+    existing_config = _load_config(home_dir)
+    existing_auto_update, existing_install_commit = _load_existing_update_settings(existing_config)
     install_commit = existing_install_commit or _detect_install_commit()
 
     auto_update_default = True if first_setup else existing_auto_update
@@ -72,9 +90,9 @@ def run_setup(home_dir: Path | None = None) -> None:
         _abort()
 
     # Step 2: Discover all available plugins
-    all_plugins = discover_plugins()
-    existing_values = _load_existing_plugin_values(home_dir, all_plugins)
-    existing_enabled = _load_existing_enabled_plugins(home_dir)
+    all_plugins = discover_plugins_cached(home_dir)
+    existing_values = _load_existing_plugin_values(home_dir, all_plugins, existing_config)
+    existing_enabled = _load_existing_enabled_plugins(existing_config)
 
     # Step 3: Let user select plugins by category
     enabled_plugins: list[PluginInfo] = []
@@ -149,12 +167,8 @@ def run_setup(home_dir: Path | None = None) -> None:
         extra_deps.update(plugin.pip_dependencies)
     if extra_deps:
         print(f"  Installing plugin dependencies: {', '.join(extra_deps)}")
-        import subprocess
-        subprocess.check_call(
-            [sys.executable, "-m", "pip", "install", *extra_deps],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
+        if not _install_plugin_dependencies(sorted(extra_deps)):
+            sys.exit(1)
 
     # Done
     print()
@@ -186,8 +200,9 @@ def run_plugin_setup(plugin_name: str) -> None:
     values = _configure_plugin(plugin)
     if values:
         print(f"\n  Configuration for {plugin.display_name}:")
+        secret_keys = {f.key for f in plugin.config_fields if f.type == "secret"}
         for k, v in values.items():
-            display_v = "********" if any(f.key == k and f.type == "secret" for f in plugin.config_fields) else v
+            display_v = "********" if k in secret_keys else v
             print(f"    {k}: {display_v}")
         print(f"\n  Run 'clawquant config' to apply changes to your configuration.\n")
 
@@ -207,8 +222,9 @@ def enable_plugin_with_setup(plugin_name: str, home_dir: Path | None = None) ->
     home_dir = home_dir.expanduser()
     home_dir.mkdir(parents=True, exist_ok=True)
 
-    all_plugins = discover_plugins()
-    existing_values = _load_existing_plugin_values(home_dir, all_plugins)
+    config = _load_config(home_dir)
+    all_plugins = discover_plugins_cached(home_dir)
+    existing_values = _load_existing_plugin_values(home_dir, all_plugins, config)
     current_values = existing_values.get(plugin.name, {})
 
     print_banner()
@@ -224,11 +240,6 @@ def enable_plugin_with_setup(plugin_name: str, home_dir: Path | None = None) ->
     config_path = home_dir / "config.yaml"
     env_path = home_dir / ".env"
 
-    config: dict[str, Any] = {}
-    if config_path.exists():
-        with open(config_path) as f:
-            config = yaml.safe_load(f) or {}
-
     secrets: dict[str, str] = {}
     _add_plugin_to_config(config, secrets, plugin, values)
     _ensure_plugin_enabled(config, plugin)
@@ -238,12 +249,7 @@ def enable_plugin_with_setup(plugin_name: str, home_dir: Path | None = None) ->
         f.write("# Updated by clawquant plugin enable\n\n")
         yaml.dump(config, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
-    existing_env = dotenv_values(env_path) if env_path.exists() else {}
-    env_out: dict[str, str] = {
-        str(k): str(v)
-        for k, v in existing_env.items()
-        if k and v is not None
-    }
+    env_out = _load_env_file(env_path)
     env_out.update(secrets)
     with open(env_path, "w") as f:
         f.write("# ClawQuant Secrets\n")
@@ -254,12 +260,9 @@ def enable_plugin_with_setup(plugin_name: str, home_dir: Path | None = None) ->
 
     if plugin.pip_dependencies:
         print(f"  Installing plugin dependencies: {', '.join(plugin.pip_dependencies)}")
-        import subprocess
-        subprocess.check_call(
-            [sys.executable, "-m", "pip", "install", *plugin.pip_dependencies],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
+        # The plugin is enabled in config either way; a failed install only
+        # leaves its dependencies to be installed by hand (hint printed).
+        _install_plugin_dependencies(plugin.pip_dependencies)
 
     print()
     print(f"  Enabled: {plugin.name}")
@@ -283,6 +286,13 @@ def _select_plugins(
     required = category == "ai_provider"
     existing_enabled_names = existing_enabled_names or set()
 
+    # A required category whose only option is already enabled: an empty
+    # selection would keep it anyway, so the prompt cannot change anything.
+    # Optional categories always prompt so the plugin can still be unchecked.
+    if required and len(plugins) == 1 and plugins[0].name in existing_enabled_names:
+        print(f"  {label}: {plugins[0].display_name} (only option, selected)")
+        return list(plugins)
+
     choices = [
         Choice(
             title=p.choice_label,
@@ -324,6 +334,17 @@ def _configure_plugin(plugin: PluginInfo, existing: dict[str, Any] | None = None
         return {}
     existing = existing or {}
     visible_fields = [field for field in plugin.config_fields if not field.hidden]
+    has_current = {field.key: _has_value(existing.get(field.key)) for field in visible_fields}
+
+    # Nothing to ask for: every field already has a value. Keep them without
+    # prompting unless the user forces a full reconfigure.
+    if (
+        visible_fields
+        and all(has_current.values())
+        and not _parse_bool(os.environ.get("CLAWQUANT_FORCE_RECONFIGURE"), False)
+    ):
+        print(f"  {plugin.display_name}: already configured, keeping current values.")
+        return existing
 
     # Show setup instructions if present
     instructions = plugin.setup_instructions.strip()
@@ -335,7 +356,7 @@ def _configure_plugin(plugin: PluginInfo, existing: dict[str, Any] | None = None
 
     missing_required = [
         field for field in visible_fields
-        if field.required and not _has_value(existing.get(field.key))
+        if field.required and not has_current[field.key]
     ]
     can_skip = len(missing_required) == 0
 
@@ -361,8 +382,13 @@ def _configure_plugin(plugin: PluginInfo, existing: dict[str, Any] | None = None
 
     for field in visible_fields:
         current = existing.get(field.key)
-        value = _prompt_field(field, plugin.display_name, current=current)
-        if value is None and _has_value(current):
+        value = _prompt_field(
+            field,
+            plugin.display_name,
+            current=current,
+            has_current=has_current[field.key],
+        )
+        if value is None and has_current[field.key]:
             value = current
         if value is not None:
             values[field.key] = value
@@ -377,83 +403,108 @@ def _configure_plugin(plugin: PluginInfo, existing: dict[str, Any] | None = None
     return values
 
 
-def _prompt_field(field: ConfigField, plugin_name: str, current: Any = None) -> Any:
-    """Prompt for a single config field based on its type."""
-    label = field.label
-    if field.description:
-        label = f"{field.label} ({field.description})"
-
-    default = current if _has_value(current) else field.default
-
-    match field.type:
-        case "secret":
-            value = questionary.password(
-                f"{field.label}{' (leave blank to keep current)' if _has_value(current) else ''}:",
-                style=STYLE,
-            ).ask()
-            if value is None:
-                _abort()
-            if value == "" and _has_value(current):
-                return None
-            return value
-
-        case "choice":
-            value = questionary.select(
-                f"{field.label}:",
-                choices=field.choices,
-                default=default,
-                style=STYLE,
-            ).ask()
-            if value is None:
-                _abort()
-            return value
-
-        case "boolean":
-            value = questionary.confirm(
-                f"{field.label}?",
-                default=bool(default) if default is not None else True,
-                style=STYLE,
-            ).ask()
-            if value is None:
-                _abort()
-            return value
-
-        case "number":
-            default_str = str(default) if default is not None else ""
-            value = questionary.text(
-                f"{field.label}:",
-                default=default_str,
-                style=STYLE,
-            ).ask()
-            if value is None:
-                _abort()
-            try:
-                num = float(value)
-                return int(num) if num == int(num) else num
-            except ValueError:
-                return default
-
-        case "list":
-            default_str = ", ".join(default) if isinstance(default, list) else str(default or "")
-            value = questionary.text(
-                f"{field.label} (comma-separated):",
-                default=default_str,
-                style=STYLE,
-            ).ask()
-            if value is None:
-                _abort()
-            return [item.strip() for item in value.split(",") if item.strip()]
-
-        case _:  # string
-            default_str = str(default) if default is not None else ""
-            value = questionary.text(
-                f"{field.label}:",
-                default=default_str,
-                style=STYLE,
-            ).ask()
-            if value is None:
-                _abort()
-            return value
+def _prompt_field(
+    field: ConfigField,
+    plugin_name: str,
+    current: Any = None,
+    has_current: bool | None = None,
+) -> Any:
+    """Prompt for a single config field based on its type.
+
+    `has_current` is `_has_value(current)`; callers that already know it can
+    pass it in to avoid recomputing.
+    """
+    if has_current is None:
+        has_current = _has_value(current)
+    default = current if has_current else field.default
+
+    prompter = _PROMPTERS.get(field.type, _prompt_string)
+    return prompter(field, default, has_current)
+
+
+def _prompt_secret(field: ConfigField, default: Any, has_current: bool) -> Any:
+    value = questionary.password(
+        f"{field.label}{' (leave blank to keep current)' if has_current else ''}:",
+        style=STYLE,
+    ).ask()
+    if value is None:
+        _abort()
+    if value == "" and has_current:
+        return None
+    return value
+
+
+def _prompt_choice(field: ConfigField, default: Any, has_current: bool) -> Any:
+    value = questionary.select(
+        f"{field.label}:",
+        choices=field.choices,
+        default=default,
+        style=STYLE,
+    ).ask()
+    if value is None:
+        _abort()
+    return value
+
+
+def _prompt_boolean(field: ConfigField, default: Any, has_current: bool) -> Any:
+    value = questionary.confirm(
+        f"{field.label}?",
+        default=bool(default) if default is not None else True,
+        style=STYLE,
+    ).ask()
+    if value is None:
+        _abort()
+    return value
+
+
+def _prompt_number(field: ConfigField, default: Any, has_current: bool) -> Any:
+    default_str = str(default) if default is not None else ""
+    value = questionary.text(
+        f"{field.label}:",
+        default=default_str,
+        style=STYLE,
+    ).ask()
+    if value is None:
+        _abort()
+    try:
+        num = float(value)
+        return int(num) if num == int(num) else num
+    except ValueError:
+        return default
+
+
+def _prompt_list(field: ConfigField, default: Any, has_current: bool) -> Any:
+    default_str = ", ".join(default) if isinstance(default, list) else str(default or "")
+    value = questionary.text(
+        f"{field.label} (comma-separated):",
+        default=default_str,
+        style=STYLE,
+    ).ask()
+    if value is None:
+        _abort()
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _prompt_string(field: ConfigField, default: Any, has_current: bool) -> Any:
+    default_str = str(default) if default is not None else ""
+    value = questionary.text(
+        f"{field.label}:",
+        default=default_str,
+        style=STYLE,
+    ).ask()
+    if value is None:
+        _abort()
+    return value
+
+
+# ConfigField.type -> prompt function; anything else is prompted as a string
+_PROMPTERS: dict[str, Callable[[ConfigField, Any, bool], Any]] = {
+    "secret": _prompt_secret,
+    "choice": _prompt_choice,
+    "boolean": _prompt_boolean,
+    "number": _prompt_number,
+    "list": _prompt_list,
+}
 
 
 def _run_plugin_setup_hook(
@@ -508,6 +559,35 @@ def _run_plugin_setup_hook(
     return {}
 
 
+def _pip_install(packages: list[str]) -> None:
+    """Quietly pip-install packages into the running interpreter's environment.
+
+    Skips pip's self-version check (a network round-trip) and never prompts.
+    Raises CalledProcessError on failure.
+    """
+    subprocess.run(
+        [
+            sys.executable, "-P", "-m", "pip", "install",
+            "--disable-pip-version-check", "--no-input", "-q",
+            *packages,
+        ],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _install_plugin_dependencies(packages: list[str]) -> bool:
+    """pip-install plugin dependencies, printing a readable message on failure."""
+    try:
+        _pip_install(packages)
+    except (subprocess.CalledProcessError, OSError):
+        print("  Failed to install plugin dependencies.")
+        print(f"  Install them manually: pip install {shlex.join(packages)}")
+        return False
+    return True
+
+
 def _abort() -> None:
     """User pressed Ctrl+C or cancelled."""
     print("\n  Setup cancelled.\n")
@@ -524,20 +604,49 @@ def _has_value(value: Any) -> bool:
     return True
 
 
+def _load_config(home_dir: Path) -> dict[str, Any]:
+    """Parse home_dir/config.yaml (libyaml loader when available), or {} if missing."""
+    config_path = home_dir / "config.yaml"
+    if not config_path.exists():
+        return {}
+    with open(config_path) as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
+def _load_env_file(env_path: Path) -> dict[str, str]:
+    """Parse the KEY=VALUE .env file written by setup, or {} if missing.
+
+    Deliberately minimal (no interpolation or multiline values): comments
+    and blank lines are skipped and matching surrounding quotes stripped.
+    """
+    if not env_path.exists():
+        return {}
+
+    env: dict[str, str] = {}
+    for line in env_path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        key = key.strip()
+        if key.startswith("export "):
+            key = key[len("export "):].strip()
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in ("'", '"'):
+            value = value[1:-1]
+        if key:
+            env[key] = value
+    return env
+
+
 def _load_existing_plugin_values(
     home_dir: Path,
     all_plugins: dict[str, list[PluginInfo]],
+    config: dict[str, Any],
 ) -> dict[str, dict[str, Any]]:
-    """Load existing config/env and map values per plugin."""
-    config_path = home_dir / "config.yaml"
+    """Map existing config (parsed config.yaml) and .env values per plugin."""
     env_path = home_dir / ".env"
-
-    config: dict[str, Any] = {}
-    if config_path.exists():
-        with open(config_path) as f:
-            config = yaml.safe_load(f) or {}
-
-    env = dotenv_values(env_path) if env_path.exists() else {}
+    env = _load_env_file(env_path)
 
     by_name: dict[str, PluginInfo] = {
         p.name: p
@@ -560,28 +669,18 @@ def _load_existing_plugin_values(
 
 def _read_plugin_values_from_config(config: dict[str, Any], plugin: PluginInfo) -> dict[str, Any]:
     """Extract existing values for a plugin from config.yaml shape."""
-    values: dict[str, Any] = {}
-    category = plugin.category
-
-    if category == "ai_provider":
-        values = (((config.get("ai") or {}).get("providers") or {}).get(plugin.name) or {}).copy()
-    elif category == "market_data":
-        values = (((config.get("market_data") or {}).get("providers") or {}).get(plugin.name) or {}).copy()
-    elif category == "integration":
-        integ = ((config.get("integrations") or {}).get(plugin.name) or {}).copy()
-        channels = integ.get("channels") or []
+    path = _CATEGORY_PATHS.get(plugin.category)
+    if path is None:
+        return {}
+
+    values: dict[str, Any] = (_dig(config, path).get(plugin.name) or {}).copy()
+    if plugin.category == "integration":
+        channels = values.get("channels") or []
         if channels and isinstance(channels, list):
             first = channels[0] or {}
             for key in ("chat_id", "direction"):
                 if key in first:
-                    integ[key] = first[key]
-        values = integ
-    elif category == "risk_rule":
-        values = (((config.get("risk") or {}).get("rules") or {}).get(plugin.name) or {}).copy()
-    elif category == "task_handler":
-        values = (((config.get("scheduler") or {}).get("handlers") or {}).get(plugin.name) or {}).copy()
-    elif category == "agent":
-        values = (((config.get("ai") or {}).get("agents") or {}).get(plugin.name) or {}).copy()
+                    values[key] = first[key]
 
     # Strip generic keys that are not direct field values
     values.pop("enabled", None)
@@ -589,45 +688,14 @@ def _read_plugin_values_from_config(config: dict[str, Any], plugin: PluginInfo)
     return values
 
 
-def _load_existing_enabled_plugins(home_dir: Path) -> dict[str, set[str]]:
-    """Load currently enabled plugin names by category."""
-    config_path = home_dir / "config.yaml"
-    config: dict[str, Any] = {}
-    if config_path.exists():
-        with open(config_path) as f:
-            config = yaml.safe_load(f) or {}
-
+def _load_existing_enabled_plugins(config: dict[str, Any]) -> dict[str, set[str]]:
+    """Currently enabled plugin names by category, from parsed config.yaml."""
     out: dict[str, set[str]] = {category: set() for category in CATEGORY_ORDER}
 
-    ai_providers = ((config.get("ai") or {}).get("providers") or {})
-    for name, cfg in ai_providers.items():
-        if not isinstance(cfg, dict) or cfg.get("enabled", True):
-            out["ai_provider"].add(name)
-
-    md_providers = ((config.get("market_data") or {}).get("providers") or {})
-    for name, cfg in md_providers.items():
-        if not isinstance(cfg, dict) or cfg.get("enabled", True):
-            out["market_data"].add(name)
-
-    integrations = config.get("integrations") or {}
-    for name, cfg in integrations.items():
-        if not isinstance(cfg, dict) or cfg.get("enabled", True):
-            out["integration"].add(name)
-
-    agents = ((config.get("ai") or {}).get("agents") or {})
-    for name, cfg in agents.items():
-        if not isinstance(cfg, dict) or cfg.get("enabled", True):
-            out["agent"].add(name)
-
-    rules = ((config.get("risk") or {}).get("rules") or {})
-    for name, cfg in rules.items():
-        if not isinstance(cfg, dict) or cfg.get("enabled", True):
-            out["risk_rule"].add(name)
-
-    handlers = ((config.get("scheduler") or {}).get("handlers") or {})
-    for name, cfg in handlers.items():
-        if not isinstance(cfg, dict) or cfg.get("enabled", True):
-            out["task_handler"].add(name)
+    for category, path in _CATEGORY_PATHS.items():
+        for name, cfg in _dig(config, path).items():
+            if not isinstance(cfg, dict) or cfg.get("enabled", True):
+                out[category].add(name)
 
     return out
 
@@ -647,18 +715,8 @@ def _parse_bool(value: Any, default: bool = False) -> bool:
     return default
 
 
-def _load_existing_update_settings(home_dir: Path) -> tuple[bool, str]:
-    """Read existing updates settings from config if present."""
-    config_path = home_dir / "config.yaml"
-    if not config_path.exists():
-        return False, ""
-
-    try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f) or {}
-    except Exception:
-        return False, ""
-
+def _load_existing_update_settings(config: dict[str, Any]) -> tuple[bool, str]:
+    """Read existing updates settings from parsed config.yaml if present."""
     updates = config.get("updates")
     if not isinstance(updates, dict):
         return False, ""
@@ -700,29 +758,17 @@ def _detect_install_commit() -> str:
 
 def _ensure_plugin_enabled(config: dict[str, Any], plugin: PluginInfo) -> None:
     """Set enabled=true for categories that support explicit enable flags."""
-    if plugin.category == "ai_provider":
-        providers = (config.get("ai") or {}).get("providers") or {}
-        entry = providers.get(plugin.name)
-        if isinstance(entry, dict):
-            entry["enabled"] = True
-    elif plugin.category == "market_data":
-        providers = (config.get("market_data") or {}).get("providers") or {}
-        entry = providers.get(plugin.name)
-        if isinstance(entry, dict):
-            entry["enabled"] = True
-    elif plugin.category == "integration":
-        entry = (config.get("integrations") or {}).get(plugin.name)
-        if isinstance(entry, dict):
-            entry["enabled"] = True
-    elif plugin.category == "task_handler":
-        entry = (((config.get("scheduler") or {}).get("handlers") or {}).get(plugin.name))
-        if isinstance(entry, dict):
-            entry["enabled"] = True
-    elif plugin.category == "agent":
-        entry = (((config.get("ai") or {}).get("agents") or {}).get(plugin.name))
-        if isinstance(entry, dict):
-            entry["enabled"] = True
-    elif plugin.category == "risk_rule":
-        entry = (((config.get("risk") or {}).get("rules") or {}).get(plugin.name))
-        if isinstance(entry, dict):
-            entry["enabled"] = True
+    path = _CATEGORY_PATHS.get(plugin.category)
+    if path is None:
+        return
+    entry = _dig(config, path).get(plugin.name)
+    if isinstance(entry, dict):
+        entry["enabled"] = True
+
+
+def _dig(config: dict[str, Any], path: tuple[str, ...]) -> dict[str, Any]:
+    """Walk nested config sections, treating missing/empty ones as {}."""
+    section = config
+    for key in path:
+        section = section.get(key) or {}
+    return section
@@ -6,7 +6,9 @@ output adapters that support send_text().
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from typing import Any, Awaitable, Callable
 
 from core.models.events import Event
 from core.registry import PluginRegistry
@@ -30,10 +32,8 @@ class OutputDispatcher:
         channel_id = payload.get("channel_id")
         adapter_name = payload.get("adapter")
 
-        outputs = self._registry.get_all("output")
-        delivered = 0
-
-        for output in outputs:
+        senders = []
+        for output in self._registry.get_all("output"):
             if adapter_name and getattr(output, "name", None) != adapter_name:
                 continue
 
@@ -41,14 +41,11 @@ class OutputDispatcher:
             if send_text is None:
                 continue
 
-            try:
-                await send_text(text, channel_id=channel_id)
-                delivered += 1
-            except Exception:
-                logger.exception(
-                    "Failed delivering integration.output via %s",
-                    getattr(output, "name", "unknown"),
-                )
+            senders.append(self._send(output, send_text, text, channel_id))
+
+        # Adapters are independent, so deliver to all of them concurrently.
+        results = await asyncio.gather(*senders)
+        delivered = sum(results)
 
         if delivered == 0:
             logger.warning(
@@ -56,3 +53,20 @@ class OutputDispatcher:
                 adapter_name,
                 channel_id,
             )
+
+    @staticmethod
+    async def _send(
+        output: Any,
+        send_text: Callable[..., Awaitable[Any]],
+        text: str,
+        channel_id: Any,
+    ) -> bool:
+        try:
+            await send_text(text, channel_id=channel_id)
+            return True
+        except Exception:
+            logger.exception(
+                "Failed delivering integration.output via %s",
+                getattr(output, "name", "unknown"),
+            )
+            return False
@@ -498,6 +498,14 @@ async def run(config_path: str | None = None, env_path: str | None = None) -> No
             except Exception as e:
                 logger.error("Error closing LLM provider %s: %s", getattr(provider, "name", "?"), e)
 
+        # Close task handlers holding network clients
+        for handler in registry.get_all("task_handler"):
+            try:
+                if hasattr(handler, "close"):
+                    await handler.close()
+            except Exception as e:
+                logger.error("Error closing task handler %s: %s", getattr(handler, "name", "?"), e)
+
         store.close()
         await runner.cleanup()
         logger.info("Shutdown complete")
@@ -4,13 +4,19 @@ from __future__ import annotations
 
 import logging
 import os
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from functools import lru_cache
 from typing import Any
 
 import httpx
 
 from core.models.tasks import TaskResult
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to httpx's stdlib json.
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 PLUGIN_META = {
@@ -55,6 +61,9 @@ class WebSearchHandler:
 
     def __init__(self, default_limit: int = 5) -> None:
         self._default_limit = default_limit
+        # Created on first search and reused so repeat calls keep the
+        # TCP/TLS connection to the search API alive.
+        self._client: httpx.AsyncClient | None = None
 
     @property
     def name(self) -> str:
@@ -114,17 +123,16 @@ class WebSearchHandler:
         payload: dict[str, Any] = {"q": query, "num": limit}
         if as_of:
             # Best-effort date bound understood by Google-compatible search backends.
-            payload["tbs"] = f"cdr:1,cd_max:{as_of.strftime('%m/%d/%Y')}"
+            payload["tbs"] = _tbs_for(as_of.date())
 
         try:
-            async with httpx.AsyncClient(timeout=20.0) as client:
-                response = await client.post(
-                    "https://google.serper.dev/search",
-                    headers={"X-API-KEY": api_key, "Content-Type": "application/json"},
-                    json=payload,
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await self._get_client().post(
+                "https://google.serper.dev/search",
+                headers={"X-API-KEY": api_key, "Content-Type": "application/json"},
+                json=payload,
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content) if orjson is not None else response.json()
         except Exception:
             logger.exception("web_search request failed")
             return "Web search failed due to API/network error."
@@ -139,14 +147,14 @@ class WebSearchHandler:
             link = str(item.get("link", "")).strip()
             snippet = str(item.get("snippet", "")).strip()
             date_text = str(item.get("date", "")).strip()
-            line = f"{idx}. {title}" if title else f"{idx}. {link}"
+            parts = [f"{idx}. {title or link}"]
             if date_text:
-                line += f" ({date_text})"
+                parts.append(f" ({date_text})")
             if link:
-                line += f"\n   {link}"
+                parts.append(f"\n   {link}")
             if snippet:
-                line += f"\n   {snippet}"
-            lines.append(line)
+                parts.append(f"\n   {snippet}")
+            lines.append("".join(parts))
 
         as_of_note = ""
         if as_of:
@@ -154,6 +162,19 @@ class WebSearchHandler:
 
         return f"Web results for '{query}':\n" + "\n".join(lines) + as_of_note
 
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=20.0,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            )
+        return self._client
+
     async def run(self, params: dict) -> TaskResult:
         """No scheduled behavior by default; this plugin is primarily tool-driven."""
         return TaskResult(
@@ -166,12 +187,28 @@ def _parse_as_of(value: Any) -> datetime | None:
     if not value:
         return None
     if isinstance(value, datetime):
-        dt = value
-    else:
-        try:
-            dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
-        except ValueError:
-            return None
+        return _to_utc(value)
+    return _parse_as_of_str(str(value))
+
+
+@lru_cache(maxsize=128)
+def _parse_as_of_str(value: str) -> datetime | None:
+    # Agents tend to repeat the same cutoff across tool calls. fromisoformat()
+    # accepts a trailing "Z" natively on Python 3.11+.
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return _to_utc(dt)
+
+
+@lru_cache(maxsize=32)
+def _tbs_for(as_of_date: date) -> str:
+    """Google-style custom date range ending on as_of_date."""
+    return f"cdr:1,cd_max:{as_of_date.strftime('%m/%d/%Y')}"
+
+
+def _to_utc(dt: datetime) -> datetime:
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)